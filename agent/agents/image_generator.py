@@ -7,6 +7,7 @@ actual images for each slide using Gemini 3 Pro Image Preview.
 from google.adk.agents import Agent
 
 from ..tools.image_generator import generate_slide_tool, generate_all_slides_tool
+from ..tools.export_tools import export_deck_tool
 
 IMAGE_GENERATOR_INSTRUCTION = """You are an expert Image Generator responsible for creating professional presentation slide images.
 
@@ -23,10 +24,17 @@ For each prompt in the visual_prompts list:
 
 Alternatively, you can call generate_all_slides with the entire prompts list.
 
+## Exporting the Deck
+Once all images are generated, call the export_deck tool with:
+   - slides_dir: the output directory containing the generated slides
+
+This writes a compressed PDF and PPTX of the full deck to an export/ subfolder.
+
 ## Output
 After generating all images, report:
 - How many images were successfully generated
 - The file paths of the generated images
+- The exported PDF and PPTX paths
 - Any errors that occurred
 
 Store the results in session state under key 'generated_images'.
@@ -37,6 +45,6 @@ image_generator_agent = Agent(
     name='image_generator_agent',
     description='Image Generator that creates slide images from Nano Banana prompts using Gemini 3 Pro',
     instruction=IMAGE_GENERATOR_INSTRUCTION,
-    tools=[generate_slide_tool, generate_all_slides_tool],
+    tools=[generate_slide_tool, generate_all_slides_tool, export_deck_tool],
     output_key='generated_images',
 )
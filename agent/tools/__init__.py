@@ -14,6 +14,11 @@ from .image_generator import (
     generate_all_slides,
 )
 
+from .export_tools import (
+    export_deck_tool,
+    export_deck,
+)
+
 __all__ = [
     "docx_to_pdf_tool",
     "read_docx_tool",
@@ -23,4 +28,6 @@ __all__ = [
     "generate_all_slides_tool",
     "generate_slide_image",
     "generate_all_slides",
+    "export_deck_tool",
+    "export_deck",
 ]
@@ -0,0 +1,351 @@
+"""Deck export tool for assembling generated slides into deliverables.
+
+This tool takes the slide_NN images from a run's output directory,
+re-encodes them in parallel across a process pool, and streams the
+results into a single PDF and PPTX ready for emailing.
+"""
+
+import multiprocessing
+import os
+import re
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from google.adk.tools import FunctionTool
+
+
+# Slide files produced by generate_slide_image (e.g. "slide_01.png")
+SLIDE_FILE_PATTERN = re.compile(r"^slide_(\d+)\.(png|jpe?g|webp)$", re.IGNORECASE)
+
+# 16:9 page width in PDF points (13.333in, matching PowerPoint's widescreen layout)
+PDF_PAGE_WIDTH = 960
+
+# 16:9 slide size in EMUs (13.333in x 7.5in)
+PPTX_SLIDE_WIDTH = 12192000
+PPTX_SLIDE_HEIGHT = 6858000
+
+
+def find_slide_images(slides_dir: str) -> list[str]:
+    """List slide images in a run's output directory, ordered by slide number.
+
+    A slide regenerated into the same directory may exist under more than
+    one extension; only the most recently written file is kept.
+
+    Args:
+        slides_dir: Directory containing slide_NN.<ext> files.
+
+    Returns:
+        Sorted list of absolute paths to the slide images, one per slide number.
+    """
+    slides = {}
+    for name in os.listdir(slides_dir):
+        match = SLIDE_FILE_PATTERN.match(name)
+        if match:
+            slide_number = int(match.group(1))
+            path = os.path.join(slides_dir, name)
+            current = slides.get(slide_number)
+            if current is None or os.path.getmtime(path) > os.path.getmtime(current):
+                slides[slide_number] = path
+
+    return [slides[number] for number in sorted(slides)]
+
+
+def _encode_slide(job: dict) -> dict:
+    """Re-encode one slide image; runs inside a worker process.
+
+    Only file paths cross the process boundary, so each worker holds at
+    most one decoded slide in memory at a time.
+    """
+    from PIL import Image
+
+    source_path = job["source_path"]
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+
+    with Image.open(source_path) as im:
+        # Flatten transparency onto white; a plain RGB convert turns it black
+        if im.mode in ("RGBA", "LA") or (im.mode == "P" and "transparency" in im.info):
+            rgba = im.convert("RGBA")
+            im = Image.new("RGB", rgba.size, "white")
+            im.paste(rgba, mask=rgba.getchannel("A"))
+        else:
+            im = im.convert("RGB")
+
+        # Downscale oversized renders; slides are never shown larger than this
+        if im.width > job["max_width"]:
+            height = round(im.height * job["max_width"] / im.width)
+            im = im.resize((job["max_width"], height), Image.Resampling.LANCZOS)
+
+        # JPEG is embedded directly into the PDF and PPTX
+        jpeg_path = os.path.join(job["output_dir"], f"{stem}.jpg")
+        im.save(jpeg_path, "JPEG", quality=job["jpeg_quality"], optimize=True)
+
+        webp_path = None
+        if job["webp_quality"] is not None:
+            webp_path = os.path.join(job["output_dir"], f"{stem}.webp")
+            im.save(webp_path, "WEBP", quality=job["webp_quality"], method=6)
+
+        thumbnail_path = None
+        if job["thumbnail_width"]:
+            thumbnail_path = os.path.join(job["thumbnail_dir"], f"{stem}.jpg")
+            thumb = im.copy()
+            thumb.thumbnail((job["thumbnail_width"], job["thumbnail_width"]), Image.Resampling.LANCZOS)
+            thumb.save(thumbnail_path, "JPEG", quality=job["jpeg_quality"], optimize=True)
+
+        return {
+            "source_path": source_path,
+            "jpeg_path": jpeg_path,
+            "webp_path": webp_path,
+            "thumbnail_path": thumbnail_path,
+            "width": im.width,
+            "height": im.height,
+        }
+
+
+def _write_pdf(pdf_path: str, pages: list[dict]) -> None:
+    """Stream JPEG pages into a PDF file, one image at a time.
+
+    The JPEG bytes are embedded as-is (DCTDecode), so nothing is decoded
+    and only one file chunk is buffered at any moment.
+    """
+    offsets = []
+
+    with open(pdf_path, "wb") as f:
+        def begin_object(obj_id: int) -> None:
+            offsets.append(f.tell())
+            f.write(f"{obj_id} 0 obj\n".encode())
+
+        f.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+
+        # Objects 1 and 2 are the catalog and page tree; each page then
+        # takes three consecutive objects: page, image, content stream.
+        begin_object(1)
+        f.write(b"<< /Type /Catalog /Pages 2 0 R >>\nendobj\n")
+
+        kids = " ".join(f"{3 + 3 * i} 0 R" for i in range(len(pages)))
+        begin_object(2)
+        f.write(f"<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>\nendobj\n".encode())
+
+        for i, page in enumerate(pages):
+            page_id, image_id, content_id = 3 + 3 * i, 4 + 3 * i, 5 + 3 * i
+            page_width = PDF_PAGE_WIDTH
+            page_height = round(PDF_PAGE_WIDTH * page["height"] / page["width"], 2)
+
+            begin_object(page_id)
+            f.write((
+                f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {page_width} {page_height}] "
+                f"/Resources << /XObject << /Im0 {image_id} 0 R >> >> "
+                f"/Contents {content_id} 0 R >>\nendobj\n"
+            ).encode())
+
+            begin_object(image_id)
+            f.write((
+                f"<< /Type /XObject /Subtype /Image /Width {page['width']} /Height {page['height']} "
+                f"/ColorSpace /DeviceRGB /BitsPerComponent 8 /Filter /DCTDecode "
+                f"/Length {os.path.getsize(page['jpeg_path'])} >>\nstream\n"
+            ).encode())
+            with open(page["jpeg_path"], "rb") as image_file:
+                shutil.copyfileobj(image_file, f)
+            f.write(b"\nendstream\nendobj\n")
+
+            content = f"q {page_width} 0 0 {page_height} 0 0 cm /Im0 Do Q".encode()
+            begin_object(content_id)
+            f.write(f"<< /Length {len(content)} >>\nstream\n".encode())
+            f.write(content + b"\nendstream\nendobj\n")
+
+        xref_offset = f.tell()
+        f.write(f"xref\n0 {len(offsets) + 1}\n".encode())
+        f.write(b"0000000000 65535 f \n")
+        for offset in offsets:
+            f.write(f"{offset:010d} 00000 n \n".encode())
+        f.write((
+            f"trailer\n<< /Size {len(offsets) + 1} /Root 1 0 R >>\n"
+            f"startxref\n{xref_offset}\n%%EOF\n"
+        ).encode())
+
+
+def _write_pptx(pptx_path: str, pages: list[dict]) -> None:
+    """Write a widescreen PPTX with one full-bleed image per slide."""
+    from pptx import Presentation
+
+    prs = Presentation()
+    prs.slide_width = PPTX_SLIDE_WIDTH
+    prs.slide_height = PPTX_SLIDE_HEIGHT
+    blank_layout = prs.slide_layouts[6]
+
+    for page in pages:
+        slide = prs.slides.add_slide(blank_layout)
+
+        # Fit the image inside the slide, preserving its aspect ratio
+        scale = min(PPTX_SLIDE_WIDTH / page["width"], PPTX_SLIDE_HEIGHT / page["height"])
+        width = int(page["width"] * scale)
+        height = int(page["height"] * scale)
+        slide.shapes.add_picture(
+            page["jpeg_path"],
+            (PPTX_SLIDE_WIDTH - width) // 2,
+            (PPTX_SLIDE_HEIGHT - height) // 2,
+            width=width,
+            height=height,
+        )
+
+    prs.save(pptx_path)
+
+
+def export_deck(
+    slides_dir: str,
+    output_dir: Optional[str] = None,
+    formats: Optional[list[str]] = None,
+    jpeg_quality: int = 82,
+    webp_quality: Optional[int] = 80,
+    max_width: int = 1920,
+    thumbnail_width: int = 320,
+    max_workers: Optional[int] = None,
+) -> dict:
+    """Export a run's slide images into a compressed PDF and PPTX deck.
+
+    Args:
+        slides_dir: Directory containing the slide_NN images from a run
+                   (the output_directory returned by generate_all_slides).
+        output_dir: Optional directory for the exported files; must differ from
+                   slides_dir. Defaults to <slides_dir>/export/
+        formats: Deck formats to write, any of "pdf" and "pptx" (a single
+                string is also accepted). Defaults to both.
+        jpeg_quality: JPEG quality (1-95) for the images embedded in the deck.
+        webp_quality: WebP quality (1-100) for standalone slide copies, or None to skip them.
+        max_width: Slides wider than this are downscaled before encoding.
+        thumbnail_width: Longest edge of the JPEG thumbnails, or 0 to skip them.
+        max_workers: Maximum number of encoder processes. Defaults to the CPU
+                    count; never more than the number of slides.
+
+    Returns:
+        dict with:
+            - success: bool indicating if the export succeeded
+            - pdf_path: path to the exported PDF, if requested
+            - pptx_path: path to the exported PPTX, if requested
+            - images: list of re-encoded JPEG slide paths
+            - webp_images: list of WebP slide paths
+            - thumbnails: list of thumbnail paths
+            - original_bytes: total size of the source slide images
+            - exported_bytes: total size of the exported decks
+            - error: error message if export failed
+    """
+    result = {
+        "success": False,
+        "pdf_path": None,
+        "pptx_path": None,
+        "images": [],
+        "webp_images": [],
+        "thumbnails": [],
+        "original_bytes": 0,
+        "exported_bytes": 0,
+        "error": None
+    }
+
+    try:
+        if formats is None:
+            formats = ["pdf", "pptx"]
+        elif isinstance(formats, str):
+            formats = [formats]
+        formats = [fmt.lower() for fmt in formats]
+
+        unknown = sorted(set(formats) - {"pdf", "pptx"})
+        if unknown:
+            result["error"] = f"Unsupported export format(s): {', '.join(unknown)}"
+            return result
+
+        if not 1 <= jpeg_quality <= 95:
+            result["error"] = f"jpeg_quality must be between 1 and 95, got {jpeg_quality}"
+            return result
+
+        if webp_quality is not None and not 1 <= webp_quality <= 100:
+            result["error"] = f"webp_quality must be between 1 and 100, got {webp_quality}"
+            return result
+
+        if not os.path.isdir(slides_dir):
+            result["error"] = f"Slides directory not found: {slides_dir}"
+            return result
+
+        sources = find_slide_images(slides_dir)
+        if not sources:
+            result["error"] = f"No slide_NN images found in: {slides_dir}"
+            return result
+
+        # Measure before encoding, while the sources are untouched
+        original_bytes = sum(os.path.getsize(path) for path in sources)
+
+        # Fail fast on missing libraries before spinning up the process pool
+        import PIL  # noqa: F401
+        if "pptx" in formats:
+            import pptx  # noqa: F401
+
+        if output_dir is None:
+            output_dir = os.path.join(slides_dir, "export")
+
+        # Re-encodes reuse the slide_NN names and would overwrite the sources
+        if os.path.realpath(output_dir) == os.path.realpath(slides_dir):
+            result["error"] = "output_dir must differ from slides_dir; leave it unset to use <slides_dir>/export/"
+            return result
+
+        thumbnail_dir = os.path.join(output_dir, "thumbnails")
+        os.makedirs(output_dir, exist_ok=True)
+        if thumbnail_width:
+            os.makedirs(thumbnail_dir, exist_ok=True)
+
+        jobs = [
+            {
+                "source_path": path,
+                "output_dir": output_dir,
+                "thumbnail_dir": thumbnail_dir,
+                "jpeg_quality": jpeg_quality,
+                "webp_quality": webp_quality,
+                "max_width": max_width,
+                "thumbnail_width": thumbnail_width,
+            }
+            for path in sources
+        ]
+
+        # The pool starts every worker up front, so never size it past the deck.
+        # Spawn rather than fork: the agent server is multi-threaded, and a
+        # forked child can deadlock on a lock held by another thread.
+        max_workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+        mp_context = multiprocessing.get_context("spawn")
+
+        # executor.map preserves slide order
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as executor:
+            pages = list(executor.map(_encode_slide, jobs))
+
+        deck_name = os.path.basename(os.path.normpath(slides_dir))
+
+        if "pdf" in formats:
+            result["pdf_path"] = os.path.join(output_dir, f"{deck_name}.pdf")
+            _write_pdf(result["pdf_path"], pages)
+
+        if "pptx" in formats:
+            result["pptx_path"] = os.path.join(output_dir, f"{deck_name}.pptx")
+            _write_pptx(result["pptx_path"], pages)
+
+        result["images"] = [page["jpeg_path"] for page in pages]
+        result["webp_images"] = [page["webp_path"] for page in pages if page["webp_path"]]
+        result["thumbnails"] = [page["thumbnail_path"] for page in pages if page["thumbnail_path"]]
+        result["original_bytes"] = original_bytes
+        result["exported_bytes"] = sum(
+            os.path.getsize(path) for path in (result["pdf_path"], result["pptx_path"]) if path
+        )
+        result["success"] = True
+        return result
+
+    except ImportError as e:
+        if e.name == "pptx":
+            result["error"] = "python-pptx library not installed. Run: pip install python-pptx"
+        elif e.name == "PIL":
+            result["error"] = "Pillow library not installed. Run: pip install Pillow"
+        else:
+            result["error"] = str(e)
+        return result
+    except Exception as e:
+        result["error"] = str(e)
+        return result
+
+
+# Create ADK FunctionTools for use by agents
+export_deck_tool = FunctionTool(func=export_deck)
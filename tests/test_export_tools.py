@@ -0,0 +1,119 @@
+"""Tests for the deck export tool."""
+
+import os
+import re
+
+import pytest
+
+pytest.importorskip("google.adk")
+Image = pytest.importorskip("PIL.Image")
+pptx = pytest.importorskip("pptx")
+
+from agent.tools.export_tools import export_deck, find_slide_images
+
+
+@pytest.fixture
+def slides_dir(tmp_path):
+    """A run directory holding two small generated slides."""
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    Image.new("RGB", (320, 180), "navy").save(run_dir / "slide_01.png")
+    Image.new("RGB", (320, 180), "orange").save(run_dir / "slide_02.jpg")
+    return str(run_dir)
+
+
+def test_export_deck_writes_pdf_and_pptx(slides_dir):
+    result = export_deck(slides_dir, max_workers=1)
+
+    assert result["success"], result["error"]
+    assert len(result["images"]) == 2
+    assert len(result["webp_images"]) == 2
+    assert len(result["thumbnails"]) == 2
+    assert result["original_bytes"] > 0
+
+    with open(result["pdf_path"], "rb") as f:
+        pdf = f.read()
+
+    assert pdf.startswith(b"%PDF-1.4")
+    assert b"/Count 2" in pdf
+    assert len(re.findall(rb"/Type /Page ", pdf)) == 2
+
+    # startxref must point at the xref table, and every entry at its object
+    xref_offset = int(re.search(rb"startxref\n(\d+)\n%%EOF", pdf).group(1))
+    assert pdf[xref_offset:].startswith(b"xref\n")
+    xref_lines = pdf[xref_offset:].split(b"\n")
+    size = int(xref_lines[1].split()[1])
+    assert f"/Size {size}".encode() in pdf
+    for obj_id, line in enumerate(xref_lines[3:2 + size], start=1):
+        offset = int(line[:10])
+        assert pdf[offset:].startswith(f"{obj_id} 0 obj\n".encode())
+
+    presentation = pptx.Presentation(result["pptx_path"])
+    assert len(presentation.slides) == 2
+
+
+def test_export_deck_flattens_transparency_onto_white(tmp_path):
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    Image.new("RGBA", (300, 200), (0, 0, 0, 0)).save(run_dir / "slide_01.png")
+
+    result = export_deck(str(run_dir), formats="pdf", max_workers=1)
+
+    assert result["success"], result["error"]
+    with Image.open(result["images"][0]) as im:
+        assert all(channel > 245 for channel in im.getpixel((150, 100)))
+
+
+def test_export_deck_keeps_sources(slides_dir):
+    sources = {name: os.path.getsize(os.path.join(slides_dir, name)) for name in os.listdir(slides_dir)}
+
+    result = export_deck(slides_dir, output_dir=slides_dir, max_workers=1)
+
+    assert not result["success"]
+    assert "must differ" in result["error"]
+    assert {name: os.path.getsize(os.path.join(slides_dir, name)) for name in os.listdir(slides_dir)} == sources
+
+
+def test_find_slide_images_keeps_newest_duplicate(slides_dir):
+    duplicate = os.path.join(slides_dir, "slide_01.webp")
+    Image.new("RGB", (320, 180), "green").save(duplicate)
+    older = os.path.join(slides_dir, "slide_01.png")
+    os.utime(older, (0, 0))
+
+    assert find_slide_images(slides_dir) == [duplicate, os.path.join(slides_dir, "slide_02.jpg")]
+
+
+def test_export_deck_missing_directory(tmp_path):
+    result = export_deck(str(tmp_path / "missing"))
+
+    assert not result["success"]
+    assert "not found" in result["error"]
+
+
+def test_export_deck_empty_directory(tmp_path):
+    result = export_deck(str(tmp_path))
+
+    assert not result["success"]
+    assert "No slide_NN images" in result["error"]
+
+
+def test_export_deck_unknown_format(slides_dir):
+    result = export_deck(slides_dir, formats=["pdf", "key"])
+
+    assert not result["success"]
+    assert "Unsupported export format" in result["error"]
+
+
+def test_export_deck_accepts_single_format_string(slides_dir):
+    result = export_deck(slides_dir, formats="PDF", max_workers=1)
+
+    assert result["success"], result["error"]
+    assert result["pdf_path"] and result["pptx_path"] is None
+
+
+@pytest.mark.parametrize("kwargs", [{"jpeg_quality": 0}, {"jpeg_quality": 96}, {"webp_quality": 0}, {"webp_quality": 101}])
+def test_export_deck_rejects_out_of_range_quality(slides_dir, kwargs):
+    result = export_deck(slides_dir, **kwargs)
+
+    assert not result["success"]
+    assert "quality must be between" in result["error"]